@@ -2,15 +2,116 @@
 API client module for OpenAI interactions.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Optional
-from openai import OpenAI, RateLimitError, APIError
+import random
+import weakref
+from contextlib import aclosing
+from types import MappingProxyType
+from typing import AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+import httpx
+import orjson
+from openai import (
+    AsyncOpenAI,
+    RateLimitError,
+    APIError,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+)
+from circuit_breaker import CircuitBreaker, CircuitOpenError
 from config import OpenAIConfig
 
+T = TypeVar("T")
+
+_ANALYST_PERSONA = "You are a helpful assistant who is an expert financial analyst."
+
+# Complete system prompts per analysis type, built once at import
+_PROMPTS = MappingProxyType({
+    "summary": f"{_ANALYST_PERSONA} You are provided with a cleaned up financial news article. Please summarize the key points and implications for investors.",
+    "key_points": f"{_ANALYST_PERSONA} Extract and list the top 5 key points from this financial article that investors should know about.",
+    "action_items": f"{_ANALYST_PERSONA} Based on this financial article, what actionable items should investors consider? List them clearly.",
+    "risks": f"{_ANALYST_PERSONA} Identify and explain the key risks mentioned or implied in this financial article for investors."
+})
+
+_COMBINED_PROMPT = (
+    f"{_ANALYST_PERSONA} "
+    "You are provided with a cleaned up financial news article. "
+    "Return JSON with keys: summary, key_points, action_items, risks. "
+    "\"summary\" summarizes the key points and implications for investors; "
+    "\"key_points\" lists the top 5 key points investors should know about; "
+    "\"action_items\" lists the actionable items investors should consider; "
+    "\"risks\" identifies and explains the key risks mentioned or implied for investors."
+)
+
+_QUESTION_PROMPT = f"{_ANALYST_PERSONA} Provide clear, actionable advice."
+
+_USER_TEMPLATE = "Here is the content to analyze:\n\n{content}"
+_CONTEXT_TEMPLATE = "Context:\n{context}\n\nQuestion: {question}"
+_RECOMMENDATIONS_TEMPLATE = "Provide some good websites for financial information pertaining to the {topic}. These should include both sites with news and analysis, as well as sites that provide data and statistics on {topic}, especially sites where basic financial information, such as EPS, revenue, earnings, etc. Please include a brief description of each site and what it offers."
+
+# Errors worth retrying; anything else is returned to the caller immediately
+RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Return the server-requested retry delay from a rate limit error, if any."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    
+    headers = response.headers
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        # HTTP-date values are rare for this API; fall back to backoff
+        return None
+    return None
+
+
+class RequestPacer:
+    """Spaces out request starts so they stay under a requests-per-minute limit."""
+    
+    def __init__(self, rpm_limit: int):
+        """
+        Initialize the pacer.
+        
+        Args:
+            rpm_limit: Maximum requests per minute; 0 or less disables pacing.
+        """
+        self._interval = 60.0 / rpm_limit if rpm_limit > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def wait(self):
+        """Wait until the next request slot is available."""
+        if not self._interval:
+            return
+        
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        
+        if delay > 0:
+            await asyncio.sleep(delay)
+
 
 class FinancialAnalystClient:
     """Client for interacting with OpenAI API as a financial analyst."""
     
+    # AsyncOpenAI clients per event loop, then per connection pool settings, so
+    # every instance reuses the same pooled, kept-alive connections. Pooled
+    # connections belong to the loop that opened them, so a new loop (e.g. a
+    # second asyncio.run) gets its own pool instead of dead sockets.
+    _shared_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    
     def __init__(self, config: OpenAIConfig, logger: logging.Logger):
         """
         Initialize the OpenAI client.
@@ -19,11 +120,273 @@ class FinancialAnalystClient:
             config: OpenAI configuration object.
             logger: Logger instance.
         """
-        self.client = OpenAI()
         self.config = config
         self.logger = logger
+        # Concurrency semaphore and pacer per event loop; like the pooled
+        # connections, asyncio primitives belong to the loop that first used them
+        self._loop_limits: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._cache: dict[str, str] = {}
+        # Only outage signals count; client errors (4xx) and rate limits say
+        # nothing about whether the service is up
+        self._breaker = CircuitBreaker(
+            failure_threshold=config.circuit_failure_threshold,
+            failure_window=config.circuit_failure_window,
+            reset_timeout=config.circuit_reset_timeout,
+            failure_exceptions=(APIConnectionError, APITimeoutError, InternalServerError)
+        )
+    
+    def _limits(self) -> tuple[asyncio.Semaphore, RequestPacer]:
+        """Return the concurrency semaphore and request pacer for the running event loop."""
+        loop = asyncio.get_running_loop()
+        limits = self._loop_limits.get(loop)
+        if limits is None:
+            limits = (
+                asyncio.Semaphore(self.config.max_concurrency),
+                RequestPacer(self.config.rpm_limit)
+            )
+            self._loop_limits[loop] = limits
+        return limits
+    
+    @property
+    def _sem(self) -> asyncio.Semaphore:
+        """The concurrency semaphore for the running event loop."""
+        return self._limits()[0]
+    
+    @property
+    def _pacer(self) -> RequestPacer:
+        """The request pacer for the running event loop."""
+        return self._limits()[1]
+    
+    @property
+    def client(self) -> AsyncOpenAI:
+        """The shared AsyncOpenAI client for the running event loop."""
+        return self._get_shared_client(self.config)
+    
+    @classmethod
+    def _get_shared_client(cls, config: OpenAIConfig) -> AsyncOpenAI:
+        """Return the running loop's shared AsyncOpenAI client for the configured pool, creating it if needed."""
+        clients = cls._shared_clients.setdefault(asyncio.get_running_loop(), {})
+        key = cls._pool_key(config)
+        client = clients.get(key)
+        if client is None or client.is_closed():
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=config.max_connections,
+                    max_keepalive_connections=config.max_keepalive
+                ),
+                timeout=config.timeout
+            )
+            # Retries are handled by _call_with_retry so they can honor Retry-After
+            client = AsyncOpenAI(http_client=http_client, max_retries=0)
+            clients[key] = client
+        return client
+    
+    @staticmethod
+    def _pool_key(config: OpenAIConfig) -> tuple:
+        """Return the cache key for the connection pool settings in config."""
+        return (config.max_connections, config.max_keepalive, config.timeout)
     
-    def get_website_recommendations(self, topic: str = "stock market") -> Optional[str]:
+    async def aclose(self):
+        """
+        Close the running loop's shared connection pool.
+        
+        The pool is shared by every client on this loop with the same pool
+        settings, so call this once when the application is done with the API.
+        """
+        clients = self._shared_clients.get(asyncio.get_running_loop(), {})
+        client = clients.pop(self._pool_key(self.config), None)
+        if client is not None:
+            await client.close()
+    
+    async def _call_with_retry(
+        self,
+        coro_factory: Callable[[], Awaitable[T]],
+        max_retries: Optional[int] = None
+    ) -> T:
+        """
+        Await a request, retrying transient failures with exponential backoff and jitter.
+        
+        Args:
+            coro_factory: Callable returning a fresh awaitable for each attempt.
+            max_retries: Retries after the first attempt (defaults to config.max_retries).
+            
+        Returns:
+            The result of the first successful attempt.
+            
+        Raises:
+            The last error once retries are exhausted, or any non-retryable error.
+        """
+        if max_retries is None:
+            max_retries = self.config.max_retries
+        
+        attempt = 0
+        while True:
+            try:
+                return await coro_factory()
+            except RETRYABLE_ERRORS as e:
+                if attempt >= max_retries:
+                    raise
+                
+                delay = None
+                if isinstance(e, RateLimitError):
+                    delay = _retry_after_seconds(e)
+                if delay is None:
+                    # 1s, 2s, 4s ... plus up to 1s of jitter, capped at 30s
+                    delay = min(30.0, 2.0 ** attempt + random.uniform(0, 1))
+                
+                attempt += 1
+                self.logger.warning(
+                    "%s from OpenAI, retrying in %.1fs (attempt %d/%d)",
+                    type(e).__name__, delay, attempt, max_retries
+                )
+                await asyncio.sleep(delay)
+    
+    async def _send_completion(self, messages: list[dict], **options) -> dict:
+        """Send a single chat completion request within the concurrency and rate limits."""
+        async with self._sem:
+            await self._pacer.wait()
+            # Checked only once the call is about to be sent, so queued calls
+            # fail fast if the circuit opened while they waited
+            async with self._breaker:
+                raw = await self.client.chat.completions.with_raw_response.create(
+                    model=self.config.model,
+                    temperature=self.config.temperature,
+                    messages=messages,
+                    **options
+                )
+        # Decode the JSON body directly instead of building pydantic models
+        return orjson.loads(raw.content)
+    
+    async def _create_completion(self, messages: list[dict], **options) -> dict:
+        """
+        Send a chat completion request, retrying transient failures.
+        
+        Args:
+            messages: Chat messages to send to the model.
+            **options: Extra request parameters, e.g. response_format.
+            
+        Returns:
+            dict: The decoded completion response body.
+        """
+        return await self._call_with_retry(lambda: self._send_completion(messages, **options))
+    
+    def _cache_key(self, messages: list[dict], options: dict) -> str:
+        """Return a content-addressed cache key for a request."""
+        parts = [self.config.model, str(self.config.temperature), repr(sorted(options.items()))]
+        parts.extend(f"{m['role']}:{m['content']}" for m in messages)
+        return hashlib.blake2b("|".join(parts).encode("utf-8")).hexdigest()
+    
+    async def _complete(self, messages: list[dict], **options) -> Optional[str]:
+        """
+        Return the model's reply to messages, serving repeated requests from the cache.
+        
+        Args:
+            messages: Chat messages to send to the model.
+            **options: Extra request parameters, e.g. response_format.
+            
+        Returns:
+            str: The completion text.
+        """
+        if not self.config.cache_responses:
+            response = await self._create_completion(messages, **options)
+            return response["choices"][0]["message"]["content"]
+        
+        key = self._cache_key(messages, options)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.logger.debug("Serving response from cache")
+            return cached
+        
+        response = await self._create_completion(messages, **options)
+        content = response["choices"][0]["message"]["content"]
+        if content is not None:
+            self._cache_store(key, content)
+        return content
+    
+    def _cache_store(self, key: str, content: str):
+        """Store a completion in the cache, evicting the oldest entry when full."""
+        if key not in self._cache and len(self._cache) >= self.config.cache_max_entries:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = content
+    
+    async def _open_stream(self, messages: list[dict]):
+        """
+        Open a streamed chat completion within the concurrency and rate limits.
+        
+        On success the caller owns a semaphore slot and must release it once the
+        stream has been consumed.
+        """
+        await self._sem.acquire()
+        try:
+            await self._pacer.wait()
+            async with self._breaker:
+                return await self.client.chat.completions.create(
+                    model=self.config.model,
+                    temperature=self.config.temperature,
+                    messages=messages,
+                    stream=True
+                )
+        except BaseException:
+            self._sem.release()
+            raise
+    
+    async def _stream_complete(self, messages: list[dict]) -> AsyncIterator[str]:
+        """
+        Yield the model's reply to messages as text chunks while it is generated.
+        
+        Only opening the stream is retried; a cached reply is yielded whole.
+        
+        Args:
+            messages: Chat messages to send to the model.
+            
+        Yields:
+            str: Text fragments of the completion.
+        """
+        key = self._cache_key(messages, {}) if self.config.cache_responses else None
+        cached = self._cache.get(key) if key else None
+        if cached is not None:
+            self.logger.debug("Serving response from cache")
+            yield cached
+            return
+        
+        stream = await self._call_with_retry(lambda: self._open_stream(messages))
+        parts = []
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                text = chunk.choices[0].delta.content
+                if text:
+                    parts.append(text)
+                    yield text
+        finally:
+            self._sem.release()
+            await stream.close()
+        
+        if key:
+            self._cache_store(key, "".join(parts))
+    
+    def _summary_messages(self, content: str, analysis_type: str) -> list[dict]:
+        """Build the chat messages for a summarize_content request."""
+        system_prompt = _PROMPTS.get(analysis_type, _PROMPTS["summary"])
+        
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": _USER_TEMPLATE.format(content=content)}
+        ]
+    
+    def _question_messages(self, question: str, context: Optional[str]) -> list[dict]:
+        """Build the chat messages for an ask_question request."""
+        content = question
+        if context:
+            content = _CONTEXT_TEMPLATE.format(context=context, question=question)
+        
+        return [
+            {"role": "system", "content": _QUESTION_PROMPT},
+            {"role": "user", "content": content}
+        ]
+    
+    async def get_website_recommendations(self, topic: str = "stock market") -> Optional[str]:
         """
         Get recommendations for financial websites.
         
@@ -34,33 +397,32 @@ class FinancialAnalystClient:
             str: Response containing website recommendations, or None if request fails.
         """
         try:
-            self.logger.info(f"Fetching website recommendations for: {topic}")
+            self.logger.info("Fetching website recommendations for: %s", topic)
             
-            message = f"Provide some good websites for financial information pertaining to the {topic}. These should include both sites with news and analysis, as well as sites that provide data and statistics on {topic}, especially sites where basic financial information, such as EPS, revenue, earnings, etc. Please include a brief description of each site and what it offers."
+            message = _RECOMMENDATIONS_TEMPLATE.format(topic=topic)
             
-            response = self.client.chat.completions.create(
-                model=self.config.model,
-                temperature=self.config.temperature,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant who is an expert financial analyst."},
-                    {"role": "user", "content": message}
-                ]
-            )
+            result = await self._complete([
+                {"role": "system", "content": _ANALYST_PERSONA},
+                {"role": "user", "content": message}
+            ])
             
-            self.logger.debug(f"Successfully retrieved recommendations for {topic}")
-            return response.choices[0].message.content
+            self.logger.debug("Successfully retrieved recommendations for %s", topic)
+            return result
             
         except RateLimitError:
             self.logger.error("Rate limit exceeded. Please try again later.")
             return None
+        except CircuitOpenError:
+            self.logger.error("OpenAI API is unavailable (circuit open). Please try again later.")
+            return None
         except APIError as e:
-            self.logger.error(f"OpenAI API error: {str(e)}")
+            self.logger.error("OpenAI API error: %s", e)
             return None
         except Exception as e:
-            self.logger.error(f"Unexpected error fetching recommendations: {str(e)}")
+            self.logger.error("Unexpected error fetching recommendations: %s", e)
             return None
     
-    def summarize_content(self, content: str, analysis_type: str = "summary") -> Optional[str]:
+    async def summarize_content(self, content: str, analysis_type: str = "summary") -> Optional[str]:
         """
         Summarize or analyze financial content.
         
@@ -72,40 +434,72 @@ class FinancialAnalystClient:
             str: Analysis result, or None if request fails.
         """
         try:
-            self.logger.info(f"Performing {analysis_type} analysis on content")
-            
-            prompts = {
-                "summary": "You are provided with a cleaned up financial news article. Please summarize the key points and implications for investors.",
-                "key_points": "Extract and list the top 5 key points from this financial article that investors should know about.",
-                "action_items": "Based on this financial article, what actionable items should investors consider? List them clearly.",
-                "risks": "Identify and explain the key risks mentioned or implied in this financial article for investors."
-            }
-            
-            system_prompt = prompts.get(analysis_type, prompts["summary"])
-            
-            response = self.client.chat.completions.create(
-                model=self.config.model,
-                temperature=self.config.temperature,
-                messages=[
-                    {"role": "system", "content": f"You are a helpful assistant who is an expert financial analyst. {system_prompt}"},
-                    {"role": "user", "content": f"Here is the content to analyze:\n\n{content}"}
-                ]
+            self.logger.info("Performing %s analysis on content", analysis_type)
+            
+            result = await self._complete(self._summary_messages(content, analysis_type))
+            
+            self.logger.debug("Successfully completed %s analysis", analysis_type)
+            return result
+            
+        except RateLimitError:
+            self.logger.error("Rate limit exceeded. Please try again later.")
+            return None
+        except CircuitOpenError:
+            self.logger.error("OpenAI API is unavailable (circuit open). Please try again later.")
+            return None
+        except APIError as e:
+            self.logger.error("OpenAI API error: %s", e)
+            return None
+        except Exception as e:
+            self.logger.error("Unexpected error during analysis: %s", e)
+            return None
+    
+    async def analyze_all(self, content: str) -> Optional[dict]:
+        """
+        Run every analysis type on content in a single request.
+        
+        The article is sent once and the model returns all sections as JSON, which
+        costs a quarter of the input tokens of four separate summarize_content calls.
+        
+        Args:
+            content: The financial content to analyze.
+            
+        Returns:
+            dict: Analysis results keyed by "summary", "key_points", "action_items"
+                and "risks", or None if request fails.
+        """
+        try:
+            self.logger.info("Performing combined analysis on content")
+            
+            result = await self._complete(
+                [
+                    {"role": "system", "content": _COMBINED_PROMPT},
+                    {"role": "user", "content": _USER_TEMPLATE.format(content=content)}
+                ],
+                response_format={"type": "json_object"}
             )
             
-            self.logger.debug(f"Successfully completed {analysis_type} analysis")
-            return response.choices[0].message.content
+            analyses = json.loads(result)
+            self.logger.debug("Successfully completed combined analysis")
+            return analyses
             
         except RateLimitError:
             self.logger.error("Rate limit exceeded. Please try again later.")
             return None
+        except CircuitOpenError:
+            self.logger.error("OpenAI API is unavailable (circuit open). Please try again later.")
+            return None
         except APIError as e:
-            self.logger.error(f"OpenAI API error: {str(e)}")
+            self.logger.error("OpenAI API error: %s", e)
+            return None
+        except (TypeError, json.JSONDecodeError) as e:
+            self.logger.error("Model returned invalid JSON for combined analysis: %s", e)
             return None
         except Exception as e:
-            self.logger.error(f"Unexpected error during analysis: {str(e)}")
+            self.logger.error("Unexpected error during combined analysis: %s", e)
             return None
     
-    def ask_question(self, question: str, context: Optional[str] = None) -> Optional[str]:
+    async def ask_question(self, question: str, context: Optional[str] = None) -> Optional[str]:
         """
         Ask a custom financial question.
         
@@ -117,29 +511,105 @@ class FinancialAnalystClient:
             str: Response to the question, or None if request fails.
         """
         try:
-            self.logger.info(f"Processing custom question: {question[:50]}...")
-            
-            content = question
-            if context:
-                content = f"Context:\n{context}\n\nQuestion: {question}"
-            
-            response = self.client.chat.completions.create(
-                model=self.config.model,
-                temperature=self.config.temperature,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant who is an expert financial analyst. Provide clear, actionable advice."},
-                    {"role": "user", "content": content}
-                ]
-            )
+            self.logger.info("Processing custom question: %s...", question[:50])
+            
+            result = await self._complete(self._question_messages(question, context))
             
-            return response.choices[0].message.content
+            return result
             
         except RateLimitError:
             self.logger.error("Rate limit exceeded. Please try again later.")
             return None
+        except CircuitOpenError:
+            self.logger.error("OpenAI API is unavailable (circuit open). Please try again later.")
+            return None
         except APIError as e:
-            self.logger.error(f"OpenAI API error: {str(e)}")
+            self.logger.error("OpenAI API error: %s", e)
             return None
         except Exception as e:
-            self.logger.error(f"Unexpected error processing question: {str(e)}")
+            self.logger.error("Unexpected error processing question: %s", e)
             return None
+    
+    async def summarize_content_stream(
+        self,
+        content: str,
+        analysis_type: str = "summary"
+    ) -> AsyncIterator[str]:
+        """
+        Stream a summary or analysis of financial content as it is generated.
+        
+        Args:
+            content: The financial content to analyze.
+            analysis_type: Type of analysis ("summary", "key_points", "action_items", "risks").
+            
+        Yields:
+            str: Text fragments of the analysis. Nothing more is yielded if the request fails.
+        """
+        try:
+            self.logger.info("Streaming %s analysis on content", analysis_type)
+            # aclosing releases the stream's concurrency slot as soon as the
+            # consumer stops, not when the generator is garbage-collected
+            stream = self._stream_complete(self._summary_messages(content, analysis_type))
+            async with aclosing(stream):
+                async for text in stream:
+                    yield text
+            self.logger.debug("Successfully streamed %s analysis", analysis_type)
+            
+        except RateLimitError:
+            self.logger.error("Rate limit exceeded. Please try again later.")
+        except CircuitOpenError:
+            self.logger.error("OpenAI API is unavailable (circuit open). Please try again later.")
+        except APIError as e:
+            self.logger.error("OpenAI API error: %s", e)
+        except Exception as e:
+            self.logger.error("Unexpected error during streamed analysis: %s", e)
+    
+    async def ask_question_stream(
+        self,
+        question: str,
+        context: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream the answer to a custom financial question as it is generated.
+        
+        Args:
+            question: The financial question to ask.
+            context: Optional context or document to reference.
+            
+        Yields:
+            str: Text fragments of the answer. Nothing more is yielded if the request fails.
+        """
+        try:
+            self.logger.info("Streaming answer to custom question: %s...", question[:50])
+            stream = self._stream_complete(self._question_messages(question, context))
+            async with aclosing(stream):
+                async for text in stream:
+                    yield text
+            
+        except RateLimitError:
+            self.logger.error("Rate limit exceeded. Please try again later.")
+        except CircuitOpenError:
+            self.logger.error("OpenAI API is unavailable (circuit open). Please try again later.")
+        except APIError as e:
+            self.logger.error("OpenAI API error: %s", e)
+        except Exception as e:
+            self.logger.error("Unexpected error processing streamed question: %s", e)
+    
+    async def summarize_many(
+        self,
+        contents: list[str],
+        analysis_type: str = "summary"
+    ) -> list[Optional[str]]:
+        """
+        Summarize or analyze several pieces of content concurrently.
+        
+        Args:
+            contents: The financial contents to analyze.
+            analysis_type: Type of analysis to apply to every item.
+            
+        Returns:
+            list: Analysis results in the same order as ``contents``; failed items are None.
+        """
+        return await asyncio.gather(
+            *[self.summarize_content(content, analysis_type) for content in contents]
+        )
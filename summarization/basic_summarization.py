@@ -5,14 +5,12 @@ This module provides a command-line interface for the financial summarization ap
 """
 
 import argparse
+import asyncio
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
 from config import load_config
 from logger import setup_logging
-from api_client import FinancialAnalystClient
-from summarization_service import FinancialSummarizationService
 
 
 def print_section_header(title: str):
@@ -22,11 +20,53 @@ def print_section_header(title: str):
     print(f"{'='*60}\n")
 
 
+async def print_stream(chunks) -> bool:
+    """
+    Write streamed text to stdout as it arrives.
+    
+    Args:
+        chunks: Async iterator of text fragments.
+        
+    Returns:
+        bool: True if any text was written.
+    """
+    wrote = False
+    async for text in chunks:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        wrote = True
+    if wrote:
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+    return wrote
+
+
+def read_urls_file(path: str) -> list[str]:
+    """Read article URLs from a file, one per line, skipping blank lines and # comments."""
+    with open(path, encoding="utf-8") as f:
+        lines = (line.strip() for line in f)
+        return [line for line in lines if line and not line.startswith("#")]
+
+
+async def summarize_urls(service, urls: list[str], analysis_type: str = "summary") -> bool:
+    """
+    Summarize several articles concurrently and print each result under its own header.
+    
+    Returns:
+        bool: True if every article was summarized.
+    """
+    results = await service.summarize_articles_from_urls(urls, analysis_type)
+    
+    for url, result in zip(urls, results):
+        print_section_header(f"Analyzing Article ({analysis_type.replace('_', ' ').title()})")
+        print(f"URL: {url}\n")
+        print(result if result else "Failed to summarize the article.")
+    
+    return all(results)
+
+
 def main():
     """Main entry point for the application."""
-    # Load environment variables
-    load_dotenv(override=True)
-    
     # Parse command-line arguments
     parser = argparse.ArgumentParser(
         description="Financial Content Summarization Tool",
@@ -39,9 +79,16 @@ Examples:
   # Get website recommendations
   python basic_summarization.py --websites
   
+  # Summarize several articles concurrently
+  python basic_summarization.py --urls https://example.com/a https://example.com/b
+  python basic_summarization.py --urls-file urls.txt
+  
   # Summarize with key points analysis
   python basic_summarization.py --url https://example.com --type key_points
   
+  # Run every analysis type in a single request
+  python basic_summarization.py --url https://example.com --type all
+  
   # Ask a custom financial question
   python basic_summarization.py --ask "What are the implications of rising interest rates?"
   
@@ -55,12 +102,23 @@ Examples:
         type=str,
         help="URL of the financial article to summarize"
     )
+    parser.add_argument(
+        "--urls",
+        nargs="+",
+        metavar="URL",
+        help="URLs of several financial articles to summarize concurrently"
+    )
+    parser.add_argument(
+        "--urls-file",
+        type=str,
+        help="File with one article URL per line to summarize concurrently"
+    )
     parser.add_argument(
         "--type",
         type=str,
         default="summary",
-        choices=["summary", "key_points", "action_items", "risks"],
-        help="Type of analysis to perform (default: summary)"
+        choices=["summary", "key_points", "action_items", "risks", "all"],
+        help="Type of analysis to perform; 'all' runs every type in one request (default: summary)"
     )
     parser.add_argument(
         "--websites",
@@ -96,6 +154,25 @@ Examples:
     
     args = parser.parse_args()
     
+    # Read the URL file up front so a bad file is reported as a usage error
+    if args.urls_file:
+        try:
+            file_urls = read_urls_file(args.urls_file)
+        except (OSError, UnicodeDecodeError) as e:
+            parser.error(f"cannot read --urls-file: {e}")
+        if not file_urls:
+            parser.error(f"no URLs found in --urls-file {args.urls_file}")
+        args.urls = list(args.urls or []) + file_urls
+    
+    # Deferred until the arguments are valid, so --help and usage errors
+    # exit without paying for the OpenAI SDK import
+    from dotenv import load_dotenv
+    from api_client import FinancialAnalystClient
+    from summarization_service import FinancialSummarizationService
+    
+    # Load environment variables
+    load_dotenv(override=True)
+    
     try:
         # Load configuration
         config = load_config()
@@ -106,16 +183,45 @@ Examples:
         # Setup logging
         logger = setup_logging(config.log_level, config.debug)
         logger.info("Application started")
-        logger.debug(f"Configuration loaded: model={config.openai.model}")
+        logger.debug("Configuration loaded: model=%s", config.openai.model)
+        
+        # One DNS lookup per host per TTL for every fetch in this run
+        if config.website.dns_cache_ttl > 0:
+            from util import enable_dns_cache
+            enable_dns_cache(config.website.dns_cache_ttl)
         
         # Initialize clients
         api_client = FinancialAnalystClient(config.openai, logger)
-        service = FinancialSummarizationService(api_client, logger)
+        service = FinancialSummarizationService(api_client, logger, website_config=config.website)
         
-        # Handle command-line actions
+        # Run the requested action on a single event loop
+        exit_code = asyncio.run(run_command(args, api_client, service, logger))
+        if exit_code != 0:
+            return exit_code
+        
+        logger.info("Application completed successfully")
+        return 0
+        
+    except ValueError as e:
+        print(f"Configuration Error: {str(e)}", file=sys.stderr)
+        logger.error("Configuration error: %s", e)
+        return 1
+    except KeyboardInterrupt:
+        print("\n\nApplication interrupted by user.")
+        logger.info("Application interrupted by user")
+        return 0
+    except Exception as e:
+        print(f"Unexpected Error: {str(e)}", file=sys.stderr)
+        logger.error("Unexpected error: %s", e, exc_info=True)
+        return 1
+
+
+async def run_command(args, api_client, service, logger) -> int:
+    """Dispatch the command-line action and return the process exit code."""
+    try:
         if args.websites:
             print_section_header(f"Financial Website Recommendations: {args.topic}")
-            result = api_client.get_website_recommendations(args.topic)
+            result = await api_client.get_website_recommendations(args.topic)
             if result:
                 print(result)
             else:
@@ -125,26 +231,25 @@ Examples:
         elif args.url:
             print_section_header(f"Analyzing Article ({args.type.replace('_', ' ').title()})")
             print(f"URL: {args.url}\n")
-            result = service.summarize_article_from_url(args.url, args.type)
-            if result:
-                print(result)
-            else:
+            stream = service.summarize_article_from_url_stream(args.url, args.type)
+            if not await print_stream(stream):
                 print("Failed to summarize the article.")
                 return 1
         
+        elif args.urls:
+            if not await summarize_urls(service, args.urls, args.type):
+                return 1
+        
         elif args.ask:
             print_section_header("Financial Analysis")
             print(f"Question: {args.ask}\n")
-            result = api_client.ask_question(args.ask)
-            if result:
-                print(result)
-            else:
+            if not await print_stream(api_client.ask_question_stream(args.ask)):
                 print("Failed to process the question.")
                 return 1
         
         elif args.text:
             print_section_header(f"Text Analysis ({args.type.replace('_', ' ').title()})")
-            result = service.summarize_text(args.text, args.type)
+            result = await service.summarize_text(args.text, args.type)
             if result:
                 print(result)
             else:
@@ -152,58 +257,52 @@ Examples:
                 return 1
         
         elif args.interactive:
-            run_interactive_mode(api_client, service, logger)
+            await run_interactive_mode(api_client, service, logger)
         
         else:
             # Default behavior: run demo
-            run_demo(api_client, service, logger)
+            await run_demo(api_client, service, logger)
         
-        logger.info("Application completed successfully")
         return 0
-        
-    except ValueError as e:
-        print(f"Configuration Error: {str(e)}", file=sys.stderr)
-        logger.error(f"Configuration error: {str(e)}")
-        return 1
-    except KeyboardInterrupt:
-        print("\n\nApplication interrupted by user.")
-        logger.info("Application interrupted by user")
-        return 0
-    except Exception as e:
-        print(f"Unexpected Error: {str(e)}", file=sys.stderr)
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-        return 1
+    finally:
+        # Release pooled connections before the event loop closes
+        await service.aclose()
+        await api_client.aclose()
 
 
-def run_demo(api_client, service, logger):
+async def run_demo(api_client, service, logger):
     """Run the demo workflow."""
+    article_url = "https://finance.yahoo.com/news/inflation-in-focus-as-september-fed-meeting-nears-what-to-watch-this-week-120006808.html"
+    
+    # The two requests are independent, so run them concurrently
+    recommendations, summary = await asyncio.gather(
+        api_client.get_website_recommendations(),
+        service.summarize_article_from_url(article_url)
+    )
+    
     print_section_header("Financial Website Recommendations")
     
-    result = api_client.get_website_recommendations()
-    if result:
-        print(result)
+    if recommendations:
+        print(recommendations)
     else:
         print("Failed to retrieve website recommendations.")
-        return
     
     print_section_header("Summarizing Yahoo Finance Article")
     
-    article_url = "https://finance.yahoo.com/news/inflation-in-focus-as-september-fed-meeting-nears-what-to-watch-this-week-120006808.html"
     print(f"URL: {article_url}\n")
     
-    result = service.summarize_article_from_url(article_url)
-    if result:
-        print(result)
+    if summary:
+        print(summary)
     else:
         print("Failed to summarize the article.")
 
 
-def run_interactive_mode(api_client, service, logger):
+async def run_interactive_mode(api_client, service, logger):
     """Run the interactive mode."""
     print_section_header("Interactive Mode")
     print("Available commands:")
-    print("  1. summarize <url>           - Summarize an article from URL")
-    print("  2. analyze <url> <type>      - Analyze with specific type (summary, key_points, action_items, risks)")
+    print("  1. summarize <url> [...]     - Summarize one or more articles from URLs")
+    print("  2. analyze <url> <type>      - Analyze with specific type (summary, key_points, action_items, risks, all)")
     print("  3. ask <question>            - Ask a financial question")
     print("  4. websites [topic]          - Get website recommendations")
     print("  5. help                      - Show this help message")
@@ -224,7 +323,7 @@ def run_interactive_mode(api_client, service, logger):
                 break
             
             elif command == "help":
-                print("  1. summarize <url>           - Summarize an article from URL")
+                print("  1. summarize <url> [...]     - Summarize one or more articles from URLs")
                 print("  2. analyze <url> <type>      - Analyze with specific type")
                 print("  3. ask <question>            - Ask a financial question")
                 print("  4. websites [topic]          - Get website recommendations")
@@ -233,13 +332,18 @@ def run_interactive_mode(api_client, service, logger):
             
             elif command == "summarize":
                 if len(parts) < 2:
-                    print("Usage: summarize <url>")
+                    print("Usage: summarize <url> [<url> ...]")
                     continue
-                url = parts[1]
-                print("\nAnalyzing article...")
-                result = service.summarize_article_from_url(url)
-                if result:
-                    print(f"\n{result}\n")
+                urls = user_input.split()[1:]
+                if len(urls) > 1:
+                    print(f"\nAnalyzing {len(urls)} articles...")
+                    await summarize_urls(service, urls)
+                    print()
+                    continue
+                url = urls[0]
+                print("\nAnalyzing article...\n")
+                if await print_stream(service.summarize_article_from_url_stream(url)):
+                    print()
                 else:
                     print("Failed to summarize the article.\n")
             
@@ -249,13 +353,12 @@ def run_interactive_mode(api_client, service, logger):
                     continue
                 url = parts[1]
                 analysis_type = parts[2] if len(parts) > 2 else "summary"
-                if analysis_type not in service.get_analysis_types():
-                    print(f"Invalid analysis type. Available: {', '.join(service.get_analysis_types())}")
+                if analysis_type != "all" and analysis_type not in service.get_analysis_types():
+                    print(f"Invalid analysis type. Available: {', '.join(service.get_analysis_types())}, all")
                     continue
-                print("\nAnalyzing article...")
-                result = service.summarize_article_from_url(url, analysis_type)
-                if result:
-                    print(f"\n{result}\n")
+                print("\nAnalyzing article...\n")
+                if await print_stream(service.summarize_article_from_url_stream(url, analysis_type)):
+                    print()
                 else:
                     print("Failed to analyze the article.\n")
             
@@ -264,17 +367,16 @@ def run_interactive_mode(api_client, service, logger):
                     print("Usage: ask <question>")
                     continue
                 question = " ".join(parts[1:])
-                print("\nProcessing question...")
-                result = api_client.ask_question(question)
-                if result:
-                    print(f"\n{result}\n")
+                print("\nProcessing question...\n")
+                if await print_stream(api_client.ask_question_stream(question)):
+                    print()
                 else:
                     print("Failed to process the question.\n")
             
             elif command == "websites":
                 topic = parts[1] if len(parts) > 1 else "stock market"
                 print(f"\nGetting recommendations for: {topic}...")
-                result = api_client.get_website_recommendations(topic)
+                result = await api_client.get_website_recommendations(topic)
                 if result:
                     print(f"\n{result}\n")
                 else:
@@ -287,7 +389,7 @@ def run_interactive_mode(api_client, service, logger):
             print("\n\nExiting interactive mode.")
             break
         except Exception as e:
-            logger.error(f"Error in interactive mode: {str(e)}")
+            logger.error("Error in interactive mode: %s", e)
             print(f"Error: {str(e)}\n")
 
 
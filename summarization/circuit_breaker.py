@@ -0,0 +1,125 @@
+"""
+Circuit breaker for failing fast while a remote service is unavailable.
+"""
+
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+
+
+class CircuitState(Enum):
+    """States of a circuit breaker."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Async context manager that stops calling a failing service for a cooldown period.
+
+    The circuit opens after ``failure_threshold`` failures within ``failure_window``
+    seconds. While open, calls raise CircuitOpenError immediately. After
+    ``reset_timeout`` seconds a single probe call is let through (half-open); its
+    success closes the circuit and its failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        failure_window: float = 30.0,
+        reset_timeout: float = 30.0,
+        failure_exceptions: tuple = (Exception,),
+        excluded_exceptions: tuple = ()
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Failures within the window that open the circuit.
+            failure_window: Sliding window, in seconds, for counting failures.
+            reset_timeout: Seconds to stay open before allowing a probe call.
+            failure_exceptions: Exception types that count as failures.
+            excluded_exceptions: Subtypes of failure_exceptions that do not count.
+        """
+        self.failure_threshold = failure_threshold
+        self.failure_window = failure_window
+        self.reset_timeout = reset_timeout
+        self.failure_exceptions = failure_exceptions
+        self.excluded_exceptions = excluded_exceptions
+
+        self._state = CircuitState.CLOSED
+        self._failures: deque = deque()
+        self._opened_at = 0.0
+        # Task making the half-open probe call, if one is in flight
+        self._probe_task = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state, moving from open to half-open once the cooldown ends."""
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    async def __aenter__(self):
+        state = self.state
+        if state is CircuitState.OPEN:
+            raise CircuitOpenError("Circuit is open; call rejected")
+        if state is CircuitState.HALF_OPEN:
+            if self._probe_task is not None:
+                raise CircuitOpenError("Circuit is half-open; probe already in flight")
+            self._probe_task = asyncio.current_task()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._probe_task is not None and self._probe_task is asyncio.current_task():
+            self._probe_task = None
+        elif self._state is not CircuitState.CLOSED:
+            # Admitted before the circuit opened; only the probe decides
+            # whether the service has recovered
+            return False
+
+        if exc_type is None:
+            self._record_success()
+        elif (
+            issubclass(exc_type, self.failure_exceptions)
+            and not issubclass(exc_type, self.excluded_exceptions)
+        ):
+            self._record_failure()
+
+        # Never suppress the exception
+        return False
+
+    def _record_success(self):
+        """Close the circuit and forget past failures."""
+        self._state = CircuitState.CLOSED
+        self._failures.clear()
+
+    def _record_failure(self):
+        """Record a failure and open the circuit if the threshold is reached."""
+        now = time.monotonic()
+
+        if self._state is CircuitState.HALF_OPEN:
+            self._open(now)
+            return
+
+        self._failures.append(now)
+        while self._failures and now - self._failures[0] > self.failure_window:
+            self._failures.popleft()
+
+        if len(self._failures) >= self.failure_threshold:
+            self._open(now)
+
+    def _open(self, now: float):
+        """Move to the open state."""
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+        self._failures.clear()
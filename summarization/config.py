@@ -15,13 +15,24 @@ class OpenAIConfig:
     model: str = "gpt-4o-mini"
     temperature: float = 0.7
     max_tokens: Optional[int] = None
-    timeout: int = 30
+    timeout: float = 30.0
+    max_connections: int = 2000
+    max_keepalive: int = 500
+    max_concurrency: int = 8
+    rpm_limit: int = 500
+    max_retries: int = 5
+    circuit_failure_threshold: int = 5
+    circuit_failure_window: float = 30.0
+    circuit_reset_timeout: float = 30.0
+    cache_responses: bool = True
+    cache_max_entries: int = 256
 
 
 @dataclass
 class WebsiteConfig:
     """Configuration for website scraping."""
     timeout: int = 10
+    dns_cache_ttl: float = 300.0
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
 
 
@@ -55,15 +66,23 @@ def load_config() -> AppConfig:
     # Load optional configurations from environment
     model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     temperature = float(os.getenv("OPENAI_TEMPERATURE", "0.7"))
+    max_concurrency = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+    rpm_limit = int(os.getenv("OPENAI_RPM_LIMIT", "500"))
+    max_retries = int(os.getenv("OPENAI_MAX_RETRIES", "5"))
     debug = os.getenv("DEBUG", "false").lower() == "true"
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
     
     openai_config = OpenAIConfig(
         model=model,
-        temperature=temperature
+        temperature=temperature,
+        max_concurrency=max_concurrency,
+        rpm_limit=rpm_limit,
+        max_retries=max_retries
     )
     
-    website_config = WebsiteConfig()
+    website_config = WebsiteConfig(
+        dns_cache_ttl=float(os.getenv("DNS_CACHE_TTL", "300"))
+    )
     
     return AppConfig(
         openai=openai_config,
@@ -33,7 +33,13 @@ def setup_logging(log_level: str = "INFO", debug: bool = False) -> logging.Logge
     else:
         format_string = "%(asctime)s - %(levelname)s - %(message)s"
     
-    formatter = logging.Formatter(format_string)
+    # A fixed date format skips the millisecond suffix on every record
+    formatter = logging.Formatter(format_string, datefmt="%Y-%m-%dT%H:%M:%S")
+    
+    # None of the formats use thread or process details, so skip collecting them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
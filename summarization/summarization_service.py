@@ -2,27 +2,80 @@
 Summarization service module for processing articles and content.
 """
 
+import asyncio
 import logging
-from typing import Optional
+from contextlib import aclosing
+from typing import AsyncIterator, Optional
+
+import httpx
 from util import Website
 from api_client import FinancialAnalystClient
+from config import WebsiteConfig
 
 
 class FinancialSummarizationService:
     """Service for summarizing financial content."""
     
-    def __init__(self, api_client: FinancialAnalystClient, logger: logging.Logger):
+    def __init__(
+        self,
+        api_client: FinancialAnalystClient,
+        logger: logging.Logger,
+        http_client: Optional[httpx.AsyncClient] = None,
+        website_config: Optional[WebsiteConfig] = None
+    ):
         """
         Initialize the summarization service.
         
         Args:
             api_client: OpenAI API client instance.
             logger: Logger instance.
+            http_client: Optional HTTP client for fetching articles. If omitted, one
+                is created on first use and owned by the service.
+            website_config: Website fetching configuration for the owned HTTP client.
         """
         self.api_client = api_client
         self.logger = logger
+        self.website_config = website_config or WebsiteConfig()
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+    
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Return the persistent HTTP client used for every article fetch."""
+        if self._http_client is None or self._http_client.is_closed:
+            # HTTP/2 lets many requests to one host share a single connection
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=50),
+                headers={"User-Agent": self.website_config.user_agent},
+                timeout=self.website_config.timeout,
+                follow_redirects=True
+            )
+            self._owns_http_client = True
+        return self._http_client
+    
+    async def aclose(self):
+        """Close the HTTP client if the service created it."""
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+        self._http_client = None
+    
+    async def prewarm(self, url: str):
+        """
+        Open a connection to a URL's host ahead of the real requests.
+        
+        With HTTP/2 this lets a burst of concurrent fetches to the same host share the
+        warmed connection instead of each racing to open its own. Failures are ignored.
+        
+        Args:
+            url: Any URL on the host to warm up.
+        """
+        try:
+            await self.http_client.head(Website(url).url)
+        except httpx.HTTPError as e:
+            self.logger.debug("Pre-warm request failed: %s", e)
     
-    def summarize_article_from_url(
+    async def summarize_article_from_url(
         self,
         article_url: str,
         analysis_type: str = "summary"
@@ -32,37 +85,107 @@ class FinancialSummarizationService:
         
         Args:
             article_url: URL of the article to summarize.
-            analysis_type: Type of analysis to perform.
+            analysis_type: Type of analysis to perform, or "all" to run every
+                type in a single request.
             
         Returns:
             str: Summarized content, or None if processing fails.
         """
         try:
-            self.logger.info(f"Starting article summarization from URL: {article_url}")
-            
-            # Extract content from website
-            website = Website(article_url)
-            content = website.extract_content()
+            self.logger.info("Starting article summarization from URL: %s", article_url)
             
-            if not content or content.strip() == "":
-                self.logger.error("Failed to extract content from the URL")
+            content = await self._fetch_article(article_url)
+            if content is None:
                 return None
             
-            self.logger.debug(f"Successfully extracted {len(content)} characters from article")
-            
             # Analyze the content
-            result = self.api_client.summarize_content(content, analysis_type)
+            result = await self._analyze(content, analysis_type)
             
             if result:
-                self.logger.info(f"Successfully completed {analysis_type} analysis")
+                self.logger.info("Successfully completed %s analysis", analysis_type)
             
             return result
             
         except Exception as e:
-            self.logger.error(f"Error summarizing article: {str(e)}")
+            self.logger.error("Error summarizing article: %s", e)
             return None
     
-    def summarize_text(
+    async def summarize_article_from_url_stream(
+        self,
+        article_url: str,
+        analysis_type: str = "summary"
+    ) -> AsyncIterator[str]:
+        """
+        Fetch an article from a URL and stream its summary as it is generated.
+        
+        Args:
+            article_url: URL of the article to summarize.
+            analysis_type: Type of analysis to perform. "all" is returned in one
+                piece since its sections are parsed from a single JSON reply.
+            
+        Yields:
+            str: Text fragments of the analysis. Nothing is yielded if processing fails.
+        """
+        try:
+            self.logger.info("Starting streamed article summarization from URL: %s", article_url)
+            
+            content = await self._fetch_article(article_url)
+            if content is None:
+                return
+            
+            if analysis_type == "all":
+                result = await self._analyze(content, analysis_type)
+                if result:
+                    yield result
+                return
+            
+            stream = self.api_client.summarize_content_stream(content, analysis_type)
+            async with aclosing(stream):
+                async for text in stream:
+                    yield text
+            
+        except Exception as e:
+            self.logger.error("Error summarizing article: %s", e)
+    
+    async def summarize_articles_from_urls(
+        self,
+        article_urls: list[str],
+        analysis_type: str = "summary"
+    ) -> list[Optional[str]]:
+        """
+        Fetch and summarize several articles concurrently.
+        
+        The API client's concurrency limits still apply, and all fetches share
+        the service's HTTP connection pool.
+        
+        Args:
+            article_urls: URLs of the articles to summarize.
+            analysis_type: Type of analysis to perform on every article.
+            
+        Returns:
+            list: Results in the same order as article_urls; failed articles are None.
+        """
+        self.logger.info("Summarizing %d articles", len(article_urls))
+        if len(article_urls) > 1:
+            await self.prewarm(article_urls[0])
+        return await asyncio.gather(*[
+            self.summarize_article_from_url(url, analysis_type)
+            for url in article_urls
+        ])
+    
+    async def _fetch_article(self, article_url: str) -> Optional[str]:
+        """Extract the cleaned text of an article, or None if nothing could be extracted."""
+        website = Website(article_url)
+        content = await website.extract_content_async(self.http_client)
+        
+        if not content or content.strip() == "":
+            self.logger.error("Failed to extract content from the URL")
+            return None
+        
+        self.logger.debug("Successfully extracted %d characters from article", len(content))
+        return content
+    
+    async def summarize_text(
         self,
         text: str,
         analysis_type: str = "summary"
@@ -72,29 +195,53 @@ class FinancialSummarizationService:
         
         Args:
             text: The text content to summarize.
-            analysis_type: Type of analysis to perform.
+            analysis_type: Type of analysis to perform, or "all" to run every
+                type in a single request.
             
         Returns:
             str: Analysis result, or None if processing fails.
         """
         try:
-            self.logger.info(f"Performing {analysis_type} analysis on provided text")
+            self.logger.info("Performing %s analysis on provided text", analysis_type)
             
             if not text or text.strip() == "":
                 self.logger.error("No text provided for analysis")
                 return None
             
-            result = self.api_client.summarize_content(text, analysis_type)
+            result = await self._analyze(text, analysis_type)
             
             if result:
-                self.logger.info(f"Successfully completed {analysis_type} analysis")
+                self.logger.info("Successfully completed %s analysis", analysis_type)
             
             return result
             
         except Exception as e:
-            self.logger.error(f"Error summarizing text: {str(e)}")
+            self.logger.error("Error summarizing text: %s", e)
             return None
     
+    async def _analyze(self, content: str, analysis_type: str) -> Optional[str]:
+        """Run one analysis type, or all of them in one request when analysis_type is "all"."""
+        if analysis_type != "all":
+            return await self.api_client.summarize_content(content, analysis_type)
+        
+        analyses = await self.api_client.analyze_all(content)
+        if not analyses:
+            return None
+        return self._format_analyses(analyses)
+    
+    def _format_analyses(self, analyses: dict) -> str:
+        """Render combined analysis results as titled sections."""
+        sections = []
+        for analysis_type in self.get_analysis_types():
+            value = analyses.get(analysis_type)
+            if not value:
+                continue
+            if isinstance(value, list):
+                value = "\n".join(f"- {item}" for item in value)
+            title = analysis_type.replace("_", " ").title()
+            sections.append(f"## {title}\n\n{value}")
+        return "\n\n".join(sections)
+    
     def get_analysis_types(self) -> list[str]:
         """
         Get available analysis types.
@@ -1,13 +1,377 @@
+import asyncio
+import hashlib
+import html
 import logging
+import multiprocessing
+import os
+import re
+import socket
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Optional
 from urllib.parse import urlparse
 
+import httpx
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+from urllib3.util.retry import Retry
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
+_log = logging.getLogger(__name__)
+
+# Elements whose text is never part of the article body
+UNWANTED_TAGS = frozenset(
+    {
+        "script",
+        "style",
+        "noscript",
+        "iframe",
+        "ad",
+        "img",
+        "form",
+        "nav",
+        "aside",
+        "link",
+        "button",
+        "figure",
+        "input",
+    }
+)
+_UNWANTED_SELECTOR = ", ".join(sorted(UNWANTED_TAGS))
+
+# Bodies are read in chunks and cut off past this size, so one oversized page
+# cannot exhaust memory; the parser tolerates the truncated document
+_CHUNK_SIZE = 64 * 1024
+_MAX_BODY_BYTES = 5_000_000
+
+# Metadata-only fetches read just this much of the body and match it with
+# regexes; the title and meta description sit near the top of almost every page
+_HEAD_BYTES = 8192
+_TITLE_RE = re.compile(rb"<title[^>]*>(.*?)</title\s*>", re.I | re.S)
+# Attribute names are case-insensitive but the description value is matched
+# exactly, as the full parse's CSS selector does
+_DESCRIPTION_TAG_RE = re.compile(
+    rb"""<meta\s[^>]*(?<![\w-])name\s*=\s*["']?(?-i:description)(?=["'\s/>])[^>]*>""", re.I
+)
+_CONTENT_ATTR_RE = re.compile(
+    rb"""(?<![\w-])content\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.I
+)
+# Raw-text blocks and comments whose contents must not be mistaken for markup
+_HEAD_NOISE_RE = re.compile(rb"<(script|style)\b.*?</\1\s*>|<!--.*?-->", re.I | re.S)
+_HEAD_NOISE_START_RE = re.compile(rb"<(?:script|style)\b|<!--", re.I)
+_HEAD_END_RE = re.compile(rb"</head\s*>", re.I)
+
+# Covers both <meta charset=...> and the http-equiv Content-Type form
+_CHARSET_PRESCAN_BYTES = 1024
+_META_CHARSET_RE = re.compile(rb"""<meta\s[^>]*?charset\s*=\s*["']?\s*([\w.:-]+)""", re.I)
+
+# Media types worth handing to the HTML parser
+_HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+
+# Shared by every Website so synchronous fetches reuse kept-alive connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# url -> (etag, last_modified, title, description, content), so a revisit can
+# send a conditional GET and reuse the parse on 304 Not Modified
+_PARSE_CACHE: dict[str, tuple[str, str, str, str, str]] = {}
+# blake2b digest of a body -> parsed result, so identical bodies served from
+# different URLs (mirrors, CDN variants) are only parsed once
+_BODY_CACHE: dict[bytes, tuple[str, str, str]] = {}
+_CACHE_MAX_ENTRIES = 128
+
+# (host, port, family, type, proto, flags) -> (expires_at, addresses), filled
+# once enable_dns_cache() has been called
+_DNS_CACHE: dict[tuple, tuple[float, list]] = {}
+_DNS_LOCK = threading.Lock()
+_system_getaddrinfo = socket.getaddrinfo
+
+# Worker processes for fetch_all batches, so parses of many pages use every
+# core. Created on first use, capped at the batch size. Workers are never
+# forked from this process: it is multithreaded by then (executor threads,
+# DNS lookups), and forking a multithreaded process can deadlock.
+_PARSE_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+_PARSE_POOL_WORKERS = 0
+
+
+def _parse_html(document) -> tuple[str, str, str]:
+    """Parses an HTML document with the C-backed Lexbor parser.
+    Args:
+        document (str | bytes): The HTML document.
+    Returns:
+        tuple[str, str, str]: The title, meta description and cleaned text content.
+    """
+    tree = LexborHTMLParser(document)
+
+    # Read the metadata before cleaning can strip it
+    title_node = tree.css_first("title")
+    title = (title_node.text(strip=True) if title_node else "") or "No Title"
+    description_node = tree.css_first('meta[name="description"]')
+    description = description_node.attributes.get("content") if description_node else None
+    description = (description or "").strip() or "No Description"
+
+    # Only the body contributes text, so the <head> and its script/style/link
+    # blobs are never swept or decomposed
+    root = tree.body or tree.root
+    if root is None:
+        return title, description, ""
+
+    # One CSS sweep matches every unwanted tag; strip_tags() would walk the
+    # tree once per tag for no measurable gain
+    for node in root.css(_UNWANTED_SELECTOR):
+        node.decompose()
+    # text() walks the tree in C; skip_empty drops whitespace-only nodes there
+    # instead of building and stripping a Python string for each of them
+    content = root.text(separator="\n", strip=True, skip_empty=True)
+    return title, description, content
+
+
+def _parse_body(body: bytes, encoding: str) -> tuple[str, str, str]:
+    """Decodes and parses an HTML body; top-level so worker processes can run it.
+    Args:
+        body (bytes): The raw HTML body.
+        encoding (str): The charset to decode the body with.
+    Returns:
+        tuple[str, str, str]: The title, meta description and cleaned text content.
+    """
+    return _parse_html(_decode_body(body, encoding))
+
+
+def _body_digest(body: bytes) -> bytes:
+    """Returns the _BODY_CACHE key for a raw body."""
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+def _parse_html_cached(body: bytes, encoding: str) -> tuple[str, str, str]:
+    """Decodes and parses an HTML body, reusing the result for a byte-identical body.
+    Args:
+        body (bytes): The raw HTML body.
+        encoding (str): The charset to decode the body with.
+    Returns:
+        tuple[str, str, str]: The title, meta description and cleaned text content.
+    """
+    digest = _body_digest(body)
+    parsed = _BODY_CACHE.get(digest)
+    if parsed is None:
+        parsed = _parse_body(body, encoding)
+        _cache_put(_BODY_CACHE, digest, parsed)
+    return parsed
+
+
+def _parse_pool(workers: int) -> ProcessPoolExecutor:
+    """Returns the shared parse worker pool, creating or growing it to at least workers processes."""
+    global _PARSE_POOL, _PARSE_POOL_WORKERS
+    if _PARSE_POOL is None or _PARSE_POOL_WORKERS < workers:
+        if _PARSE_POOL is not None:
+            _PARSE_POOL.shutdown(wait=False)
+        _PARSE_POOL = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context(_PARSE_START_METHOD)
+        )
+        _PARSE_POOL_WORKERS = workers
+    return _PARSE_POOL
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    """Drops a broken parse pool so the next batch starts a fresh one."""
+    global _PARSE_POOL, _PARSE_POOL_WORKERS
+    # Concurrent parses all see the same breakage; only the first one resets
+    if _PARSE_POOL is pool:
+        pool.shutdown(wait=False)
+        _PARSE_POOL = None
+        _PARSE_POOL_WORKERS = 0
+
+
+async def _parse_body_async(body: bytes, encoding: str, workers: int) -> tuple[str, str, str]:
+    """Decodes and parses an HTML body off the event loop.
+    Args:
+        body (bytes): The raw HTML body.
+        encoding (str): The charset to decode the body with.
+        workers (int): Size of the worker process pool to parse in; 1 or less parses in a thread.
+    Returns:
+        tuple[str, str, str]: The title, meta description and cleaned text content.
+    """
+    loop = asyncio.get_running_loop()
+    if workers > 1:
+        pool = _parse_pool(workers)
+        try:
+            return await loop.run_in_executor(pool, _parse_body, body, encoding)
+        except BrokenProcessPool:
+            _log.warning("Parse worker process died; recreating the pool")
+            _discard_parse_pool(pool)
+    # Lexbor releases the GIL while parsing
+    return await loop.run_in_executor(None, _parse_body, body, encoding)
+
+
+def enable_dns_cache(ttl: float = 300.0) -> None:
+    """Caches hostname lookups for ttl seconds, so repeat fetches from one host skip DNS.
+
+    requests (through urllib3) and httpx (through the event loop's resolver)
+    both resolve with socket.getaddrinfo, so wrapping it process-wide covers
+    every fetch path. Calling this again resets the cache with the new TTL.
+    Args:
+        ttl (float): Seconds a lookup result stays valid.
+    """
+
+    def cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+        key = (host, port, family, type, proto, flags)
+        now = time.monotonic()
+        entry = _DNS_CACHE.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        # Failures raise and are not cached, so the next call retries
+        addresses = _system_getaddrinfo(host, port, family, type, proto, flags)
+        # Lookups run on executor threads for the async path
+        with _DNS_LOCK:
+            _cache_put(_DNS_CACHE, key, (now + ttl, addresses))
+        return addresses
+
+    _DNS_CACHE.clear()
+    socket.getaddrinfo = cached_getaddrinfo
+
+
+def _declared_charset(response_headers, body: bytes) -> str:
+    """Returns the charset declared by the server or the document, falling back to UTF-8.
+    Args:
+        response_headers (Mapping[str, str]): The response headers.
+        body (bytes): The raw HTML body, or at least its first _CHARSET_PRESCAN_BYTES.
+    Returns:
+        str: The Content-Type charset, else a <meta> charset near the top of the body, else UTF-8.
+    """
+    for param in response_headers.get("Content-Type", "").split(";")[1:]:
+        key, _, value = param.partition("=")
+        value = value.strip(" \"'")
+        if key.strip().lower() == "charset" and value:
+            return value
+    # The HTML Standard's prescan: <meta charset> or http-equiv Content-Type
+    # in the first 1024 bytes. Not sniffed any further (requests'
+    # apparent_encoding): that costs a full chardet pass.
+    match = _META_CHARSET_RE.search(body, 0, _CHARSET_PRESCAN_BYTES)
+    if match is not None:
+        charset = match.group(1).decode("ascii").lower()
+        # A document can't be UTF-16 if its ASCII prefix was readable
+        return "utf-8" if charset.startswith("utf-16") else charset
+    return "utf-8"
+
+
+def _decode_body(body: bytes, encoding: str) -> str:
+    """Decodes an HTML body once, so the parser never has to guess its encoding."""
+    try:
+        return body.decode(encoding, errors="replace")
+    except LookupError:
+        # Unknown charset name in the header
+        return body.decode("utf-8", errors="replace")
+
+
+def _cache_put(cache: dict, key, value) -> None:
+    """Stores a value in one of the module caches, evicting the oldest entry when full."""
+    if key not in cache and len(cache) >= _CACHE_MAX_ENTRIES:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+
+def _conditional_headers(cached: Optional[tuple]) -> dict:
+    """Returns validator headers for a conditional GET from a _PARSE_CACHE entry."""
+    if cached is None:
+        return {}
+    etag, last_modified = cached[0], cached[1]
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _remember_parse(url: str, response_headers, parsed: tuple[str, str, str]) -> None:
+    """Caches a parse for url when the server supplied validators to revalidate it with."""
+    etag = response_headers.get("ETag", "")
+    last_modified = response_headers.get("Last-Modified", "")
+    if etag or last_modified:
+        _cache_put(_PARSE_CACHE, url, (etag, last_modified) + parsed)
+
+
+def _is_parseable(response_headers) -> bool:
+    """Checks from the headers alone whether a response body is worth parsing.
+    Args:
+        response_headers (Mapping[str, str]): The response headers.
+    Returns:
+        bool: False for non-HTML media types and bodies declared larger than _MAX_BODY_BYTES.
+    """
+    content_type = response_headers.get("Content-Type", "").split(";")[0].strip().lower()
+    # A missing Content-Type is left to the tolerant parser
+    if content_type and content_type not in _HTML_CONTENT_TYPES:
+        _log.warning("Skipping non-HTML response: %s", content_type)
+        return False
+    content_length = response_headers.get("Content-Length", "")
+    if content_length.isdigit() and int(content_length) > _MAX_BODY_BYTES:
+        _log.warning("Skipping response of %s bytes", content_length)
+        return False
+    return True
+
+
+def _read_capped(chunks, limit: int = _MAX_BODY_BYTES) -> bytes:
+    """Joins response body chunks, stopping once limit bytes have been read.
+    Args:
+        chunks (Iterable[bytes]): The body chunks as they arrive.
+        limit (int): The number of bytes after which reading stops.
+    Returns:
+        bytes: The body, truncated to roughly limit bytes.
+    """
+    parts = []
+    size = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return b"".join(parts)
+
+
+def _metadata_from_head(head: bytes, encoding: str) -> Optional[tuple[str, str]]:
+    """Reads the title and meta description from the start of a document without parsing it.
+    Args:
+        head (bytes): The first bytes of the HTML body.
+        encoding (str): The charset to decode matched values with.
+    Returns:
+        Optional[tuple[str, str]]: The title and meta description, or None when the
+            prefix is not conclusive and the page has to be parsed in full.
+    """
+    head = _HEAD_NOISE_RE.sub(b"", head)
+    # A block cut off by the prefix could hide anything
+    if _HEAD_NOISE_START_RE.search(head) is not None:
+        return None
+    title_match = _TITLE_RE.search(head)
+    if title_match is None:
+        return None
+    description_tag = _DESCRIPTION_TAG_RE.search(head)
+    # Without a description tag, the prefix only proves there is none if it
+    # already covers the whole <head>
+    if description_tag is None and _HEAD_END_RE.search(head) is None:
+        return None
+
+    title = html.unescape(_decode_body(title_match.group(1), encoding)).strip()
+    description = ""
+    if description_tag is not None:
+        content_match = _CONTENT_ATTR_RE.search(description_tag.group(0))
+        if content_match is None:
+            return None
+        value = next(group for group in content_match.groups() if group is not None)
+        description = html.unescape(_decode_body(value, encoding)).strip()
+    return title or "No Title", description or "No Description"
 
 
 class Website:
@@ -20,8 +384,19 @@ class Website:
         content (str): The cleaned text content extracted from the website.
     """
 
+    # No per-instance __dict__; batch runs create one Website per URL
+    __slots__ = ("url", "title", "description", "content")
+
+    # Identical for every instance, so built once. Compressed responses are
+    # decoded transparently by requests and httpx (br needs the brotli package).
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3",
+        "Accept": "text/html,application/xhtml+xml",
+        "Accept-Encoding": "gzip, deflate, br",
+    }
+
     def __init__(self, url: str):
-        """Initializes the Website class with a URL and sets up headers for requests.
+        """Initializes the Website class with a URL.
         Args:
             url (str): The URL of the website to extract content from.
         """
@@ -32,9 +407,13 @@ class Website:
         self.title = ""
         self.description = ""
         self.content = ""
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
-        }
+
+    def _request_headers(self, cached: Optional[tuple]) -> dict:
+        """Returns the headers for a fetch, adding validators when a cached parse exists."""
+        # The shared class-level dict is only copied when there is something to add
+        if cached is None:
+            return self.headers
+        return {**self.headers, **_conditional_headers(cached)}
 
     def _is_value(self, url: str) -> bool:
         """Checks if the URL is valid.
@@ -48,7 +427,7 @@ class Website:
             if all([result.scheme, result.netloc]):
                 return True
         except Exception as e:
-            logging.error(f"Error parsing URL: {e}")
+            _log.error("Error parsing URL: %s", e)
             return False
 
     def extract_content(self) -> Optional[str]:
@@ -56,75 +435,145 @@ class Website:
         Returns:
             Optional[str]: The cleaned text content from the website or None if the extraction fails.
         """
+        # Content is only set by a successful extraction, so repeat calls are free
+        if self.content:
+            return self.content
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, "html.parser")
-            # Extract title and description
-            self.title = self._get_title(soup)
-            self.description = self._get_description(soup)
-            # Clean HTML content
-            self.content = self._clean_html(soup)
+            cached = _PARSE_CACHE.get(self.url)
+            headers = self._request_headers(cached)
+            with _SESSION.get(self.url, headers=headers, timeout=10, stream=True) as response:
+                if response.status_code == 304 and cached:
+                    self.title, self.description, self.content = cached[2:]
+                    return self.content
+                response.raise_for_status()
+                if not _is_parseable(response.headers):
+                    return None
+                body = _read_capped(response.iter_content(_CHUNK_SIZE))
+                response_headers = response.headers
+
+            parsed = _parse_html_cached(body, _declared_charset(response_headers, body))
+            _remember_parse(self.url, response_headers, parsed)
+            self.title, self.description, self.content = parsed
             return self.content
 
         except requests.RequestException as e:
-            print(f"Error fetching the URL: {e}")
-            return ""
-
-    def _get_title(self, soup: BeautifulSoup) -> str:
-        """Returns the title of the webpage."""
-        if soup.title:
-            return soup.title.string.strip()
-        else:
-            return "No Title"
-
-    def _get_description(self, soup: BeautifulSoup) -> str:
-        """Returns the meta description of the webpage."""
-        description_tag = soup.find("meta", attrs={"name": "description"})
-        if description_tag and "content" in description_tag.attrs:
-            return description_tag["content"].strip()
-        else:
-            return "No Description"
-
-    def _clean_html(self, soup: BeautifulSoup) -> str:
-        """Cleans HTML content by removing unwanted elements.
+            _log.warning("Error fetching the URL: %s", e)
+            return None
+
+    def extract_metadata(self) -> Optional[tuple[str, str]]:
+        """Fetches only the title and meta description, without parsing the page.
+
+        Only the first _HEAD_BYTES of the body are downloaded and matched with
+        regexes; the full extract_content() runs only when they are not conclusive.
+        Returns:
+            Optional[tuple[str, str]]: The title and meta description, or None if the fetch fails.
+        """
+        if self.title:
+            return self.title, self.description
+        try:
+            with _SESSION.get(self.url, headers=self.headers, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                if not _is_parseable(response.headers):
+                    return None
+                head = _read_capped(response.iter_content(_HEAD_BYTES), _HEAD_BYTES)
+                encoding = _declared_charset(response.headers, head)
+        except requests.RequestException as e:
+            _log.warning("Error fetching the URL: %s", e)
+            return None
+
+        metadata = _metadata_from_head(head, encoding)
+        if metadata is None:
+            if self.extract_content() is None:
+                return None
+            return self.title, self.description
+        self.title, self.description = metadata
+        return metadata
+
+    async def extract_content_async(
+        self, client: httpx.AsyncClient, parse_workers: int = 1
+    ) -> Optional[str]:
+        """Extracts and cleans text from a website without blocking the event loop.
         Args:
-            soup (BeautifulSoup): The BeautifulSoup object containing the HTML content.
+            client (httpx.AsyncClient): HTTP client to fetch with, so connections can be pooled across URLs.
+            parse_workers (int): Worker processes to share for parsing a batch; 1 parses in this process.
         Returns:
-            str: The cleaned text content.
+            Optional[str]: The cleaned text content from the website or None if the extraction fails.
         """
-        unwanted_tags = [
-            "script",
-            "style",
-            "noscript",
-            "iframe",
-            "ad",
-            "img",
-            "form",
-            "nav",
-            "aside",
-            "link",
-            "button",
-            "figure",
-            "input",
-        ]
-        for tag in unwanted_tags:
-            for element in soup.find_all(tag):
-                element.decompose()
-        # Remove empty tags
-        for element in soup.find_all():
-            if not element.get_text(strip=True):
-                element.decompose()
-        return soup.get_text(separator="\n", strip=True)
+        if self.content:
+            return self.content
+        try:
+            cached = _PARSE_CACHE.get(self.url)
+            headers = self._request_headers(cached)
+            async with client.stream(
+                "GET", self.url, headers=headers, timeout=10, follow_redirects=True
+            ) as response:
+                if response.status_code == 304 and cached:
+                    self.title, self.description, self.content = cached[2:]
+                    return self.content
+                response.raise_for_status()
+                response_headers = response.headers
+                if not _is_parseable(response_headers):
+                    return None
+                chunks = []
+                size = 0
+                async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= _MAX_BODY_BYTES:
+                        break
+                body = b"".join(chunks)
+        except httpx.HTTPError as e:
+            _log.warning("Error fetching the URL: %s", e)
+            return None
+
+        # The body cache lives in this process, so it is checked before
+        # dispatching; only misses are decoded and parsed
+        digest = _body_digest(body)
+        parsed = _BODY_CACHE.get(digest)
+        if parsed is None:
+            parsed = await _parse_body_async(
+                body, _declared_charset(response_headers, body), parse_workers
+            )
+            _cache_put(_BODY_CACHE, digest, parsed)
+        _remember_parse(self.url, response_headers, parsed)
+        self.title, self.description, self.content = parsed
+        return self.content
+
+
+async def fetch_all(urls: list[str], client: Optional[httpx.AsyncClient] = None) -> list[Website]:
+    """Fetches and extracts several websites concurrently.
+
+    Pages are parsed in worker processes, which re-import the main module, so
+    scripts calling this need an ``if __name__ == "__main__":`` guard.
+    Args:
+        urls (list[str]): The URLs of the websites to extract content from.
+        client (Optional[httpx.AsyncClient]): HTTP client to share; a pooled one is created if omitted.
+    Returns:
+        list[Website]: One Website per URL, in order; failed fetches have empty content.
+    """
+    websites = [Website(url) for url in urls]
+    # No more worker processes than pages to parse
+    workers = min(len(websites), os.cpu_count() or 1)
+    if client is not None:
+        await asyncio.gather(
+            *(website.extract_content_async(client, workers) for website in websites)
+        )
+        return websites
+
+    limits = httpx.Limits(max_connections=50, max_keepalive_connections=50)
+    async with httpx.AsyncClient(limits=limits) as owned_client:
+        await asyncio.gather(
+            *(website.extract_content_async(owned_client, workers) for website in websites)
+        )
+    return websites
 
 
 if __name__ == "__main__":
     url = "https://finance.yahoo.com/news/inflation-in-focus-as-september-fed-meeting-nears-what-to-watch-this-week-120006808.html"
     website = Website(url)
-    if website.extract_content() is not None:
+    content = website.extract_content()
+    if content:
         print(f"Title: {website.title}")
         print(f"Description: {website.description}")
         print("\nContent Preview (first 500 characters):")
-        content = website.extract_content()
         print(f"{content[:500]}...")